@@ -8,10 +8,10 @@ setup(
 
     packages=find_packages(),  # - or find_packages(where='stem_center_analytics')
     scripts=['\scripts'],
-    install_requires=["python>=3.5.2",
-                      "cython>=0.25.2",
-                      "numpy>=1.11.3"
-                      "flask>=0.12.0",
+    python_requires=">=3.7",
+    install_requires=["cython>=0.25.2",
+                      "numpy>=1.11.3",
+                      "flask>=2.0.0",
                       "pandas>=0.19.2"],
     package_data={
         'docs': ['*.txt', '*.pdf', '*.rst'],       # documentation in text/restructured text/pdf (s)
@@ -26,22 +26,22 @@ def _run_initial_setup(debug_mode: bool=False) -> None:
     Notes
     -----
     * Perform the following checks and setups:
-        * Check that the core dependencies (pandas, flask, numpy, cython)
-          are present
+        * Check that the core dependencies (pandas, flask, numpy) and the
+          subpackages in `__all__` are present, without executing them
         * Set the constants `SOURCE_DIR`, `PROJECT_DIR`
-        * Establish wide dataframe display settings
         * If `debug_mode`=False, ensure data sources are existent and valid;
           debug mode is present to allow replacing/restoring/etc given data sources
     """
-    from sys import modules
+    from os import path
 
     from stem_center_analytics.utils import os_lib
-    # check hard dependencies
-    os_lib.ensure_successful_imports(path=__file__, names=('pandas', 'flask', 'numpy', 'cython'))
+    # check hard dependencies and subpackages in one pass
+    os_lib.ensure_successful_imports(path=__file__,
+                                     names=('pandas', 'flask', 'numpy') + __all__)
 
     global SOURCE_DIR, PROJECT_DIR
-    SOURCE_DIR = os_lib.get_path_of_python_source(modules[__name__])
-    PROJECT_DIR = os_lib.get_parent_dir(SOURCE_DIR)
+    SOURCE_DIR = path.dirname(path.abspath(__file__))
+    PROJECT_DIR = path.dirname(SOURCE_DIR)
 
     if not debug_mode:
         # ensure files and database connections are good to go
@@ -52,17 +52,23 @@ def _run_initial_setup(debug_mode: bool=False) -> None:
         with connect_to_stem_center_db():
             pass
 
-    os_lib.ensure_successful_imports(path=__file__, names=__all__)
-    from pandas import set_option
-    # establish wide dataframe display
-    set_option('display.max_rows', 50)
-    set_option('display.max_columns', 20)
-    set_option('display.width', 750)
 
+def __getattr__(name: str) -> object:
+    """Import public class APIs (`TutorLog`, `LoginData`) upon their first access.
 
-# run initial setup, and import public class APIs
+    Notes
+    -----
+    * Deferring the import of `interface` keeps `import stem_center_analytics`
+      from loading the core, warehouse, and pandas until they're actually needed
+    """
+    if name in ('TutorLog', 'LoginData'):
+        from stem_center_analytics import interface
+        return getattr(interface, name)
+    raise AttributeError(f'module \'{__name__}\' has no attribute \'{name}\'')
+
+
+# run initial setup, with public class APIs imported lazily via `__getattr__`
 _run_initial_setup(debug_mode=True)
-from stem_center_analytics.interface import TutorLog, LoginData
 
 
 # todo: separate the installs/packages needed for server/pipeline/web-service vs using as library
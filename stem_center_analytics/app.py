@@ -7,17 +7,21 @@ To test the web service locally, run the below commands from terminal:
     curl -u jeff:python -i "http://127.0.0.1:5000/?day=2013-09-25&courses=all"
     curl -u jeff:python -i "http://127.0.0.1:5000/?week=Fall+2013+-+Week+1&courses=all"
     curl -u jeff:python -i "http://127.0.0.1:5000/?quarter=Fall+2013&courses=all"
+Or equivalently, via the routes dedicated to each time range:
+    curl -u jeff:python -i "http://127.0.0.1:5000/day/2013-09-25"
+    curl -u jeff:python -i "http://127.0.0.1:5000/week/Fall%202013/1"
+    curl -u jeff:python -i "http://127.0.0.1:5000/quarter/Fall%202013"
 """
-import io
-from typing import Iterable
+import re
+import collections
+from typing import Callable, Tuple
 
 import flask
-import pandas as pd
 from flask import Flask, jsonify, make_response, request
 from flask_cors import CORS
 
-from stem_center_analytics import warehouse, PROJECT_DIR
-from stem_center_analytics.utils import os_lib, io_lib
+from stem_center_analytics import PROJECT_DIR
+from stem_center_analytics.utils import os_lib
 
 # NOTE - this web service is a temporary setup, with the data to be replaced by dynamic API calls
 
@@ -36,31 +40,59 @@ RANGE_TO_INTERVAL_MAP = {
     'week': 'day',
     'quarter': 'week'
 }
+# establish where the json files are located, with names spaced by underscores (eg: Fall_2013)
+PRE_GENERATED_DATA_DIR = os_lib.join_path(PROJECT_DIR, 'external_datasets', 'pre_generated_data')
+FILE_NAME_TABLE = str.maketrans({'+': '_', ' ': '_'})
+# establish how long (in seconds) clients may reuse a file before revalidating it via its etag
+CACHE_MAX_AGE = 3600
+# establish the format of a week in a query string (eg: 'Fall 2013 - Week 1')
+WEEK_PATTERN = re.compile(r'^(.+?) - Week\s+(\d+)$')
 
 
 @app.errorhandler(400)
-def not_found(error):
+def bad_request(error):
+    """Return json response for a request that cannot be parsed."""
     return make_response(jsonify({'error': 'Bad request'}), 400)
 
 
 @app.errorhandler(404)
 def not_found(error):
+    """Return json response for a request to an unknown route."""
     return make_response(jsonify({'error': 'Not found'}), 404)
 
 
-def _determine_quarter_by_date(date_string: str) -> str:
-    """Return quarter in which given date resides (eg: '2013-09-25'-> 'Fall 2013')."""
-    df = warehouse.get_quarter_dates()
-    date = pd.to_datetime(date_string, format='%Y-%m-%d %H:%M:%S')
-    for quarter_name in df.index:
-        quarter_row = df.ix[quarter_name]
-        if quarter_row['start_date'] <= date <= quarter_row['end_date']:
-            return quarter_name
-    raise ValueError(f'Date {date_string} does not fall between dates of any archived quarters.')
+def _parse_day(day: str) -> Tuple[str, str]:
+    """Return quarter in which given day resides, along with the day itself."""
+    # only `day` requests need the quarter dates, so defer loading warehouse (and pandas) until then
+    from stem_center_analytics import warehouse
+    return warehouse.get_quarter_by_date(day), day
+
+
+def _parse_week(raw_week: str) -> Tuple[str, str]:
+    """Return quarter name and week number of given week (eg: 'Fall 2013 - Week 1')."""
+    match = WEEK_PATTERN.match(raw_week)
+    if match is None:
+        raise ValueError(f'Week \'{raw_week}\' cannot be parsed.')
+    return match.group(1), match.group(2)
+
+
+# establish how to infer a (quarter name, time range value) pair for a given time range
+RANGE_PARSERS = {
+    'day': _parse_day,
+    'week': _parse_week,
+    'quarter': lambda raw_time_range: (raw_time_range, raw_time_range)
+}
+
+
+# establish the fields inferred from a query string, as returned by `_parse_request`
+# (courses and interval are resolved by `_respond_with_file`, as shared with the other routes)
+ParsedRequest = collections.namedtuple(
+    'ParsedRequest', ['quarter', 'time_range_type', 'time_range']
+)
 
 
-def _parse_request(request_args: flask.Request.args) -> dict:
-    """Return parsed args from route as a json response.
+def _parse_request(request_args: flask.Request.args) -> ParsedRequest:
+    """Return parsed args from route.
 
     Note: for now, only course=all is permitted.
     Sample query arguments:
@@ -69,62 +101,71 @@ def _parse_request(request_args: flask.Request.args) -> dict:
         - day=2015-09-25&course=math
     """
     # ensure query string contains two parameter names: courses, and either day, week, or quarter
-    arg_names = list(request_args.keys())
-    if (len(arg_names) != 2 or
-            'courses' not in arg_names or not
-            any((name in ['day', 'week', 'quarter']) for name in arg_names)):
+    time_range_types = RANGE_PARSERS.keys() & request_args.keys()
+    if len(request_args) != 2 or 'courses' not in request_args or len(time_range_types) != 1:
         raise ValueError('Request cannot be parsed.')
-
-    # get the parameter name corresponding to a time range (either day, week, or quarter)
-    arg_names.pop(arg_names.index('courses'))
-    time_range_type = arg_names.pop()
+    time_range_type = time_range_types.pop()
 
     # -------------------------------- Additional Inferring Below ----------------------------------
     # examples: day=2013-09-25 -- week=Fall+2013+-+Week+1 -- quarter=Fall+2013
-    courses = request_args.get('courses', type=str).split(',')
-    raw_time_range = request_args.get(time_range_type, type=str).replace('+', ' ')
-    
-    if time_range_type == 'day':
-        quarter_name, time_range_value = _determine_quarter_by_date(raw_time_range), raw_time_range
-    elif time_range_type == 'week':
-        quarter_name, time_range_value = raw_time_range.split(' - ')
-        time_range_value = time_range_value.replace('Week', '').strip()
-    elif time_range_type == 'quarter':
-        time_range_value, quarter_name = raw_time_range, raw_time_range
-    else:
-        raise ValueError('Internal Error.')
-    interval_type = RANGE_TO_INTERVAL_MAP[time_range_type]
-    # eg: Fall 2013 day week 1 ['all']
-    # print(quarter_name, interval_type, time_range_type, time_range_value, courses)
-    return {'quarter': quarter_name,
-            'interval': interval_type,
-            'range': {time_range_type: time_range_value},
-            'courses': courses}
-
-
-def _get_file(quarter: str, time_range_type: str,
-              time_range: str, interval: str,
-              courses: Iterable[str]=('all',)) -> io.TextIOWrapper:
-    """Return json file corresponding to given data.
+    # (note that flask already decodes any '+' in the query string as a space)
+    quarter_name, time_range_value = RANGE_PARSERS[time_range_type](request_args[time_range_type])
+    # eg: Fall 2013 week 1
+    return ParsedRequest(quarter=quarter_name, time_range_type=time_range_type,
+                         time_range=time_range_value)
+
+
+def _resolve_file(quarter: str, time_range_type: str,
+                  time_range: str, interval: str,
+                  courses: Tuple[str, ...]=('all',)) -> str:
+    """Return path to the json file corresponding to given data.
+
+    Raises
+    ------
+    ValueError
+        * If any courses other than 'all' are given
+    FileNotFoundError
+        * If no file was pre-generated for the given data
 
     Examples
     --------
-    _get_file(quarter='Fall+2013', time_range_type='quarter',
-              time_range='Fall+2013', interval='week')
-    _get_file(quarter='Fall+2013', time_range_type='week',
-              time_range='1', interval='day'))
-    _get_file(quarter='Fall+2013', time_range_type='day',
-              time_range='2013-09-25', interval='hour'))
+    _resolve_file(quarter='Fall+2013', time_range_type='quarter',
+                  time_range='Fall+2013', interval='week')
+    _resolve_file(quarter='Fall+2013', time_range_type='week',
+                  time_range='1', interval='day'))
+    _resolve_file(quarter='Fall+2013', time_range_type='day',
+                  time_range='2013-09-25', interval='hour'))
     """
     if courses != 'all' and courses != ('all',) and courses != ['all']:
         raise ValueError('No specific courses supported yet.')
-    time_range_ = time_range.replace('+', ' ').replace(' ', '_')
+    time_range_ = time_range.translate(FILE_NAME_TABLE)
     matched_file = os_lib.join_path(
-        PROJECT_DIR, 'external_datasets', 'pre_generated_data',
-        quarter.replace('+', ' ').replace(' ', '_'),
+        PRE_GENERATED_DATA_DIR, quarter.translate(FILE_NAME_TABLE),
         f'time_range={time_range_type}+{time_range_}&interval={interval}.json'
     )
-    return io_lib.read_json_file(matched_file)
+    os_lib.ensure_file_exists(matched_file)
+    return matched_file
+
+
+def _respond_with_file(parse_range: Callable[[], Tuple[str, str]],
+                       time_range_type: str) -> flask.Response:
+    """Return json file for the (quarter, time range) pair returned by `parse_range`.
+
+    Notes
+    -----
+    * Any error raised while parsing the time range or retrieving the file
+      is reported as a bad request
+    """
+    try:
+        quarter, time_range = parse_range()
+        courses = tuple(request.args.get('courses', default='all', type=str).split(','))
+        interval = RANGE_TO_INTERVAL_MAP[time_range_type]
+        file_path = _resolve_file(quarter, time_range_type, time_range, interval, courses)
+        # the pre-generated files already contain serialized json, so pass them through as is
+        return flask.send_file(file_path, mimetype='application/json',
+                               conditional=True, max_age=CACHE_MAX_AGE)
+    except (ValueError, FileNotFoundError):
+        flask.abort(400)
 
 
 # fixme: add dispatching error handling for invalid tokens in url routes
@@ -132,22 +173,34 @@ def _get_file(quarter: str, time_range_type: str,
 def main():
     """Core web service function.
 
-    Take the below return values from parse_request, extract them,
-    and pass to get_file as parameters.
-
-    {'quarter': quarter_name,
-     'interval': interval_type,
-     'range': {time_range_type: time_range_value},
-     'courses': courses}
+    Parse the query string into a `ParsedRequest` of quarter, time range type,
+    and time range, and respond with the corresponding pre-generated file,
+    with its interval and courses resolved as for every other route.
     """
     try:
-        arg_dict = _parse_request(request.args)
-        time_range_type = list(arg_dict['range'].keys()).pop()
-        time_range = arg_dict['range'][time_range_type]
-        interval, quarter, courses = arg_dict['interval'], arg_dict['quarter'], arg_dict['courses']
-        return jsonify(_get_file(quarter, time_range_type, time_range, interval, courses))
-    except (ValueError, FileNotFoundError):
+        parsed_request = _parse_request(request.args)
+    except ValueError:
         flask.abort(400)
+    return _respond_with_file(lambda: (parsed_request.quarter, parsed_request.time_range),
+                              parsed_request.time_range_type)
+
+
+@app.route('/day/<day>', methods=['GET'])
+def get_day(day: str):
+    """Return hourly data for given day (eg: /day/2013-09-25)."""
+    return _respond_with_file(lambda: _parse_day(day), 'day')
+
+
+@app.route('/week/<quarter>/<int:week>', methods=['GET'])
+def get_week(quarter: str, week: int):
+    """Return daily data for given week in quarter (eg: /week/Fall 2013/1)."""
+    return _respond_with_file(lambda: (quarter, str(week)), 'week')
+
+
+@app.route('/quarter/<quarter>', methods=['GET'])
+def get_quarter(quarter: str):
+    """Return weekly data for given quarter (eg: /quarter/Fall 2013)."""
+    return _respond_with_file(lambda: (quarter, quarter), 'quarter')
 
 
 if __name__ == '__main__':
@@ -7,6 +7,12 @@ InvalidInputError : Class, Subclass of ValueError
 AliasTable : Class, Subclass of object
     Lookup table for user-defined name mappings, with two lookup methods
     `lookup_by_alias` and `lookup_by_ordering`
+IntRangeAliasTable : Class, Subclass of AliasTable
+    Lookup table for integer ranges (eg: years), with aliases checked rather than stored
+PrefixAliasTable : Class, Subclass of AliasTable
+    Lookup table in which aliases may be abbreviated (eg: 'engin' for 'engineering')
+QuarterYearAliasTable : Class, Subclass of AliasTable
+    Lookup table for terms followed by years (eg: 'Fall 2013'), with names generated on demand
 AliasTable instances : AliasTable object
     Global constant instances of `AliasTable`, ie `COLUMN_NAMES`
 Functions with names that start with 'parse'
@@ -22,17 +28,27 @@ Notes
   and right of the dash are parsed, as it doesn't make sense to return
   all the immediate values (eg `parse_datetimes`). Thus, such functions
   only parse ranges (dashed input) and nothing more.
+* `parse_date`, `parse_time`, `parse_datetime`, and `parse_quarter` are memoized,
+  as are the helpers `_segment_course_name` and `_get_all_courses` behind
+  `parse_course`, since the same strings tend to be parsed repeatedly (eg: when
+  cleaning each row of a dataset). `parse_course`, `parse_user_input`, and
+  `parse_dates` themselves are not cached
 """
 import re
+import sys
 import types
+import bisect
+import numbers
+import functools
 import datetime
-import collections
-from typing import Sequence, Union, Tuple, List, Set
+from typing import Callable, Sequence, Union, Tuple, List, Set, FrozenSet
 
-import numpy as np
-import pandas as pd
+# note: pandas and `warehouse` (which depends on pandas) are imported only within the functions
+# that need them, so that aliases and courses can be parsed without loading pandas
 
-from stem_center_analytics import warehouse
+
+# establish table for removing the separators (underscores and spaces) allowed in table entries
+_SEPARATOR_DELETION_TABLE = str.maketrans('', '', '_ ')
 
 
 class InvalidInputError(ValueError):
@@ -68,6 +84,8 @@ class AliasTable(object):
         Search collection for a name corresponding to given alias
     lookup_by_alias(alias, raise_if_not_found=True) -> matched_name or None
         Search collection for a name corresponding to given alias
+    get_ordering(name, raise_if_not_found=True) -> matched_ordering or None
+        Search collection for the ordering corresponding to given name
 
     Raises
     ------
@@ -82,7 +100,10 @@ class AliasTable(object):
 
     Notes
     -----
-    * The values in the table are stored internally in an Ordered Dictionary
+    * The values in the table are stored internally in an (insertion ordered) dictionary,
+      along with a reverse dictionary of aliases for constant time lookups
+    * Rows are validated only in debug mode, that is, unless python is run
+      with the -O flag
 
     Examples
     --------
@@ -113,31 +134,54 @@ class AliasTable(object):
 
     def __init__(self, *args: Tuple[str, Set[str]]):
         """Initialize collection with any number of string, set of string pairs."""
-        for pair in args:
-            if (len(pair) != 2 or not isinstance(pair, tuple) or not
-                    isinstance(pair[0], str) or not isinstance(pair[1], set)):
-                raise ValueError('Cannot construct AliasTable object - '
-                                 'ALL arguments must be a two-item tuple '
-                                 'consisting of a string and set of strings.')
-            if any(not isinstance(entry, str) or not entry.replace('_', '').replace(' ', '').isalnum()
-                   for entry in {pair[0]} | pair[1]):
-                raise ValueError('Cannot construct AliasTable object - '
-                                 'ALL strings in the collection can only contain '
-                                 'letters, digits, spaces, and underscores.')
-        self._ordered_mapping = collections.OrderedDict(args)
+        if __debug__:  # rows are only hand written, so skip validating them when run with -O
+            for pair in args:
+                if (len(pair) != 2 or not isinstance(pair, tuple) or not
+                        isinstance(pair[0], str) or not isinstance(pair[1], (set, frozenset))):
+                    raise ValueError('Cannot construct AliasTable object - '
+                                     'ALL arguments must be a two-item tuple '
+                                     'consisting of a string and set of strings.')
+                if any(not isinstance(entry, str) or
+                       not entry.translate(_SEPARATOR_DELETION_TABLE).isalnum()
+                       for entry in {pair[0]} | pair[1]):
+                    raise ValueError('Cannot construct AliasTable object - '
+                                     'ALL strings in the collection can only contain '
+                                     'letters, digits, spaces, and underscores.')
+        self._populate(args)
+
+    @classmethod
+    def _from_trusted(cls, *args: Tuple[str, Set[str]]) -> 'AliasTable':
+        """Return table built from rows that were already validated (eg: rows of other tables)."""
+        table = cls.__new__(cls)
+        table._populate(args)
+        return table
+
+    def _populate(self, args: Sequence[Tuple[str, Set[str]]]) -> None:
+        """Fill table with given (validated) rows."""
+        # names are interned, since they're returned by lookups and then compared against (eg: courses)
+        self._ordered_mapping = dict(
+            (sys.intern(name), frozenset(aliases)) for name, aliases in args
+        )
         self.names = tuple(self._ordered_mapping.keys())
+        self._name_to_ordering = {name: ordering for ordering, name in enumerate(self.names, 1)}
+        # reverse mapping for alias lookups, with earlier rows taking precedence for shared aliases
+        self._alias_to_name = {}
+        for name, aliases in self._ordered_mapping.items():
+            for alias in aliases:
+                self._alias_to_name.setdefault(alias, name)
 
     def __str__(self):
         """Return table with each row containing ordering, name, and aliases."""
         # build 2D sequence of strings, with aliases separated by commas in increasing length order
         rows = [('ORDERING', 'NAME', 'ALIASES')]
+        mapping = self._ordered_mapping  # bound once, as subclasses build it on demand
         for ordering, name in enumerate(self.names):
-            aliases = sorted(self._ordered_mapping[name], key=lambda item: (len(item), item))
+            aliases = sorted(mapping[name], key=lambda item: (len(item), item))
             description = ', '.join(aliases) if aliases else '--'
             rows.append((ordering + 1, name, description))
         # compute desired column width by finding length of widest cell in each column
         grid = [[str(col).strip(' ') for col in row] for row in rows]
-        cell_widths = [max([len(v) for v in col]) for col in np.array(grid).T]
+        cell_widths = [max(len(v) for v in col) for col in zip(*grid)]
         table_width = 3 * len(grid[0]) + sum(cell_widths) + 1
 
         def build_row(row):
@@ -155,7 +199,9 @@ class AliasTable(object):
         Parameters
         ----------
         ordering : integer or string
-            Relative ordering corresponding to a name in the table.
+            Relative ordering corresponding to a name in the table. Integral
+            floats (eg: 1.0) and strings of ascii digits (eg: ' 2') are also
+            accepted, whereas anything else is taken as out of bounds
         raise_if_not_found : boolean, default True
             Determines whether to raise an `InvalidInputError` in the
             case of an invalid row number or to return None instead
@@ -172,13 +218,49 @@ class AliasTable(object):
         --------
         * Documentation's 'Examples' section of containing class `AliasTable`
         """
-        try:
-            ordering = int(ordering) - 1  # convert from 1 based to 0 based indexing
-            return self.names[ordering]
-        except (TypeError, ValueError, IndexError):
-            if not raise_if_not_found:
-                return None
-            raise InvalidInputError(ordering, f'ordering must fall between 1 and {len(self.names)}.')
+        # convert from 1 based to 0 based indexing, with anything non-integral taken as out of bounds
+        if isinstance(ordering, numbers.Integral):  # includes numpy integers (eg: from a DF)
+            index = int(ordering) - 1
+        elif isinstance(ordering, numbers.Real) and float(ordering).is_integer():
+            index = int(ordering) - 1
+        elif (isinstance(ordering, str) and ordering.strip().isdecimal() and
+              ordering.strip().isascii()):
+            index = int(ordering) - 1
+        else:
+            index = -1
+        if 0 <= index < len(self.names):
+            return self.names[index]
+
+        if not raise_if_not_found:
+            return None
+        raise InvalidInputError(ordering, f'ordering must fall between 1 and {len(self.names)}.')
+
+    def get_ordering(self, name: str, raise_if_not_found: bool=True) -> Union[None, int]:
+        """Return relative ordering of given name in table (inverse of `lookup_by_ordering`).
+
+        Parameters
+        ----------
+        name : string
+            Name in the table (NOT an alias)
+        raise_if_not_found : boolean, default True
+            Determines whether to raise an `InvalidInputError` in the
+            case of a name not in the table or to return None instead
+
+        Returns
+        -------
+        None or integer
+
+        Raises
+        ------
+        `InvalidInputError`
+        """
+        ordering = self._name_to_ordering.get(name)
+        if ordering is not None:
+            return ordering
+
+        if not raise_if_not_found:
+            return None
+        raise InvalidInputError(name, 'is not a name in the table.')
 
     def lookup_by_alias(self, alias: str, raise_if_not_found: bool=True) -> Union[None, str]:
         """Lookup name in table according to its alias.
@@ -205,9 +287,9 @@ class AliasTable(object):
         --------
         * Documentation's 'Examples' section of containing class `AliasTable`
         """
-        for token in self._ordered_mapping.keys():
-            if alias in self._ordered_mapping[token]:
-                return token
+        name = self._alias_to_name.get(alias)
+        if name is not None:
+            return name
 
         if not raise_if_not_found:
             return None
@@ -215,6 +297,204 @@ class AliasTable(object):
         raise InvalidInputError(alias, f'cannot be recognized as one of {valid_names}')
 
 
+class IntRangeAliasTable(AliasTable):
+
+    """Lookup table for a range of integers, each aliased by its own string.
+
+    Behaves as an `AliasTable` with a row for each integer in the range
+    [start, stop), but aliases are checked arithmetically rather than stored.
+
+    Parameters
+    ----------
+    start : integer
+        First (smallest) name in the table
+    stop : integer
+        Integer following the last name in the table
+    alias_last_two_digits : boolean, default False
+        Determines whether names may also be referred to by their last two
+        digits (eg: '13' for '2013'), assuming the range spans a single century
+
+    Examples
+    --------
+    >>> YEARS = IntRangeAliasTable(2000, 2100, alias_last_two_digits=True)
+    >>> YEARS.lookup_by_alias('2013'), YEARS.lookup_by_alias('13'), YEARS.lookup_by_alias('05')
+    ('2013', '2013', '2005')
+    >>> YEARS.lookup_by_alias('013', raise_if_not_found=False)
+
+    >>> YEARS.lookup_by_ordering(14), YEARS.get_ordering('2013')
+    ('2013', 14)
+    """
+
+    def __init__(self, start: int, stop: int, alias_last_two_digits: bool=False):
+        """Initialize collection with integers in given range."""
+        self._range = range(start, stop)
+        self._alias_last_two_digits = alias_last_two_digits
+        # nothing stored, left empty for the error reporting of base class
+        self._alias_to_name, self._name_to_ordering = {}, {}
+        self.names = tuple(str(number) for number in self._range)
+
+    @property
+    def _ordered_mapping(self) -> dict:
+        """Return name -> aliases mapping, only generated on demand (eg: for printing)."""
+        return dict(
+            (name, frozenset((name, name[-2:]) if self._alias_last_two_digits else (name,)))
+            for name in self.names
+        )
+
+    def lookup_by_alias(self, alias: str, raise_if_not_found: bool=True) -> Union[None, str]:
+        """Lookup name in table according to its alias.
+
+        See Also
+        --------
+        * Method `lookup_by_alias` of base class `AliasTable`
+        """
+        if isinstance(alias, str) and alias.isdigit() and alias.isascii():
+            if self._alias_last_two_digits and len(alias) == 2:
+                number = self._range.start - self._range.start % 100 + int(alias)
+            else:
+                number = int(alias) if alias == str(int(alias)) else None
+            if number in self._range:
+                return str(number)
+        return super().lookup_by_alias(alias, raise_if_not_found)
+
+    def get_ordering(self, name: str, raise_if_not_found: bool=True) -> Union[None, int]:
+        """Return relative ordering of given name in table.
+
+        See Also
+        --------
+        * Method `get_ordering` of base class `AliasTable`
+        """
+        if isinstance(name, str) and name.isdigit() and name.isascii() and name == str(int(name)):
+            if int(name) in self._range:
+                return int(name) - self._range.start + 1
+        return super().get_ordering(name, raise_if_not_found)
+
+
+class QuarterYearAliasTable(AliasTable):
+
+    """Lookup table for academic terms followed by a year (eg: 'Fall 2013').
+
+    Behaves as an `AliasTable` with a row for each term of each year in the
+    range [start_year, stop_year), in which every name is its own only alias.
+    Names are generated only when needed (eg: for lookup by ordering).
+
+    Parameters
+    ----------
+    terms : tuple of strings
+        Academic terms in the order they occur within a year
+    start_year : integer
+        First year in the table
+    stop_year : integer
+        Year following the last year in the table
+
+    Examples
+    --------
+    >>> QUARTERS = QuarterYearAliasTable(('Winter', 'Fall'), 2000, 2100)
+    >>> QUARTERS.lookup_by_alias('Fall 2013')
+    'Fall 2013'
+    >>> QUARTERS.lookup_by_alias('fall 2013', raise_if_not_found=False)
+
+    >>> QUARTERS.lookup_by_ordering(4), QUARTERS.get_ordering('Fall 2001')
+    ('Fall 2001', 4)
+    """
+
+    def __init__(self, terms: Tuple[str, ...], start_year: int, stop_year: int):
+        """Initialize collection with given terms for each year in given range."""
+        self._ordered_terms = tuple(terms)
+        self._term_to_ordering = {term: ordering for ordering, term in enumerate(terms, 1)}
+        self._years = range(start_year, stop_year)
+        # nothing stored, left empty for the error reporting of base class
+        self._alias_to_name, self._name_to_ordering = {}, {}
+        self._names = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Return names in the table, generated upon first access."""
+        if self._names is None:
+            self._names = tuple(f'{term} {year}' for year in self._years for term in self._ordered_terms)
+        return self._names
+
+    @property
+    def _ordered_mapping(self) -> dict:
+        """Return name -> aliases mapping, only generated on demand (eg: for printing)."""
+        return dict((name, frozenset((name,))) for name in self.names)
+
+    def lookup_by_alias(self, alias: str, raise_if_not_found: bool=True) -> Union[None, str]:
+        """Lookup name in table according to its alias.
+
+        See Also
+        --------
+        * Method `lookup_by_alias` of base class `AliasTable`
+        """
+        if isinstance(alias, str):
+            term, _, year = alias.partition(' ')
+            if (term in self._term_to_ordering and len(year) == 4 and
+                    year.isdigit() and year.isascii() and int(year) in self._years):
+                return alias
+        return super().lookup_by_alias(alias, raise_if_not_found)
+
+    def get_ordering(self, name: str, raise_if_not_found: bool=True) -> Union[None, int]:
+        """Return relative ordering of given name in table, computed from its term and year.
+
+        See Also
+        --------
+        * Method `get_ordering` of base class `AliasTable`
+        """
+        if self.lookup_by_alias(name, raise_if_not_found=False) is not None:
+            term, _, year = name.partition(' ')
+            year_offset = int(year) - self._years.start
+            return year_offset * len(self._ordered_terms) + self._term_to_ordering[term]
+        return super().get_ordering(name, raise_if_not_found)
+
+
+class PrefixAliasTable(AliasTable):
+
+    """Lookup table for name and aliases, in which aliases may be abbreviated.
+
+    Behaves as an `AliasTable`, except that an alias not found in the table
+    is taken as the beginning of an alias, and matched if all the aliases it
+    begins belong to the same name.
+
+    Examples
+    --------
+    >>> a0 = ('english',     {'engl', 'english'})
+    >>> a1 = ('engineering', {'eng', 'engineering'})
+    >>> NAMES = PrefixAliasTable(a0, a1)
+    >>> NAMES.lookup_by_alias('eng'), NAMES.lookup_by_alias('engin'), NAMES.lookup_by_alias('engli')
+    ('engineering', 'engineering', 'english')
+    >>> NAMES.lookup_by_alias('en', raise_if_not_found=False)
+
+    """
+
+    MIN_PREFIX_LENGTH = 3
+
+    def _populate(self, args: Sequence[Tuple[str, Set[str]]]) -> None:
+        """Fill table with given (validated) rows, and sort aliases for prefix search."""
+        super()._populate(args)
+        self._sorted_aliases = tuple(sorted(self._alias_to_name))
+
+    def lookup_by_alias(self, alias: str, raise_if_not_found: bool=True) -> Union[None, str]:
+        """Lookup name in table according to its alias, or the beginning of its alias.
+
+        See Also
+        --------
+        * Method `lookup_by_alias` of base class `AliasTable`
+        """
+        name = self._alias_to_name.get(alias)
+        if name is not None:
+            return name
+        if isinstance(alias, str) and len(alias) >= self.MIN_PREFIX_LENGTH:
+            # aliases starting with given prefix are adjacent once sorted
+            start = bisect.bisect_left(self._sorted_aliases, alias)
+            end = start
+            while end < len(self._sorted_aliases) and self._sorted_aliases[end].startswith(alias):
+                end += 1
+            matched_names = {self._alias_to_name[match] for match in self._sorted_aliases[start:end]}
+            if len(matched_names) == 1:
+                return matched_names.pop()
+        return super().lookup_by_alias(alias, raise_if_not_found)
+
+
 #region Name Mapping Definitions for column, other unit, and time unit label names
 COLUMN_NAMES = AliasTable(
     ('date',            {'date', 'date_of_request'}),
@@ -242,10 +522,8 @@ TIME_UNIT_NAMES = AliasTable(
 
 # region Name Mapping Definitions for column, other unit, and time unit value
 TIME_UNIT_VALUES = types.SimpleNamespace(
-    # generate args i.e.: [('0', {'0'}), ..., ('23', {'23'})]
-    HOURS=AliasTable(
-        *[(str(hr), {str(hr)}) for hr in range(0, 24)]
-    ),
+    # names '0', ..., '23'
+    HOURS=IntRangeAliasTable(0, 24),
     WEEKDAYS=AliasTable(
         ('Monday',    {'m', 'mo', 'mon'}),
         ('Tuesday',   {'t', 'tu', 'tue', 'tues'}),
@@ -255,13 +533,9 @@ TIME_UNIT_VALUES = types.SimpleNamespace(
         ('Saturday',  {'s', 'sa', 'sat'}),
         ('Sunday',    {'u', 'su', 'sun'})
     ),
-    WEEKS_IN_SUMMER_QUARTER=AliasTable(
-        *[(str(wk), {str(wk)}) for wk in range(1, 7)]
-    ),
-    # generate args i.e.: [('1', {'1'}), ..., ('12', {'12'})]
-    WEEKS_IN_QUARTER=AliasTable(
-        *[(str(wk), {str(wk)}) for wk in range(1, 13)]
-    ),
+    WEEKS_IN_SUMMER_QUARTER=IntRangeAliasTable(1, 7),
+    # names '1', ..., '12'
+    WEEKS_IN_QUARTER=IntRangeAliasTable(1, 13),
     MONTHS=AliasTable(
         ('January',   {'jan', 'january'}),
         ('February',  {'feb', 'february'}),
@@ -282,16 +556,10 @@ TIME_UNIT_VALUES = types.SimpleNamespace(
         ('Spring', {'s', 'sp', 'spr', 'spring'}),
         ('Summer', {'u', 'su', 'sum', 'summer'})
     ),
-    # generate args i.e.: [('2000', {'2000', '00'}), ..., ('2099', {'99', '2099'})]
-    YEARS=AliasTable(
-        *[(str(yr), {str(yr), str(yr)[-2:]}) for yr in range(2000, 2100)]
-    ),
+    # names '2000', ..., '2099', each also referred to by its last two digits (eg: '13')
+    YEARS=IntRangeAliasTable(2000, 2100, alias_last_two_digits=True),
     # generate current format (as stored in db) possibilities, i.e.: 'F 2013', 'W 2014', ...
-    QUARTERS_WITH_YEARS=AliasTable(
-        *[((qtr_name + ' ' + str(qtr_yr)), {qtr_name + ' ' + str(qtr_yr)})
-          for qtr_yr in range(2000, 2100)
-          for qtr_name in ('Winter', 'Spring', 'Summer', 'Fall')]
-    )
+    QUARTERS_WITH_YEARS=QuarterYearAliasTable(('Winter', 'Spring', 'Summer', 'Fall'), 2000, 2100)
 )
 # endregion
 
@@ -316,14 +584,23 @@ OTHER_SUBJECTS = AliasTable(
     ('English',                 {'engl', 'english'}),
     ('History',                 {'history', 'hist'})
 )
-ALL_SUBJECTS = AliasTable(
+# rows were already validated upon construction of the core and other subject tables
+ALL_SUBJECTS = PrefixAliasTable._from_trusted(
     *(list(CORE_SUBJECTS._ordered_mapping.items()) + list(OTHER_SUBJECTS._ordered_mapping.items()))
 )
 # endregion
 
+# bound lookups used by the parsing functions below, resolved once rather than on every call
+_LOOKUP_QUARTER = TIME_UNIT_VALUES.QUARTERS.lookup_by_alias
+_LOOKUP_YEAR = TIME_UNIT_VALUES.YEARS.lookup_by_alias
+_LOOKUP_SUBJECT = ALL_SUBJECTS.lookup_by_alias
+
+# pattern for segmenting a course name at its first digit, see `parse_course`
+_FIRST_DIGIT_PATTERN = re.compile(r'\d')
+
 
-def parse_user_input(user_input: Union[str, Sequence[str]], mapping_func: callable(str),
-                     values_to_slice: Sequence[Union[str, object]]=()) \
+def parse_user_input(user_input: Union[str, Sequence[str]], mapping_func: Callable[[str], object],
+                     values_to_slice: Union[Sequence[Union[str, object]], AliasTable]=()) \
         -> Union[List[Union[str, object]], Tuple[str, str], Tuple[object, object]]:
     """Maps each token of a dashed, comma-delimited, or sequence of strings.
 
@@ -338,9 +615,11 @@ def parse_user_input(user_input: Union[str, Sequence[str]], mapping_func: callab
     mapping_func : one str arg function
         The function in which each string element extracted from `user_input`
         is mapped with.
-    values_to_slice : array-like of str, default ()
+    values_to_slice : array-like of str or AliasTable, default ()
         Assumed as either empty, or a list of all possible mapped values, in
-        which is sliced in the case of a dashed string.
+        which is sliced in the case of a dashed string. If a table is given,
+        its names are sliced according to their orderings, which avoids
+        searching for the mapped values.
 
     Returns
     -------
@@ -374,33 +653,52 @@ def parse_user_input(user_input: Union[str, Sequence[str]], mapping_func: callab
     ['Foo', 'Bar', 'Baz']
     >>> parse_user_input('Foo', str.capitalize, ['Foo', 'Bar', 'Baz'])
     ['Foo']
+    >>> parse_user_input('fa 13 - w 14', parse_quarter, TIME_UNIT_VALUES.QUARTERS_WITH_YEARS)
+    ['Fall 2013', 'Winter 2014']
     """
-    if isinstance(user_input, Sequence) and not isinstance(user_input, str):
-        return [mapping_func(' '.join(s.split())) for s in user_input]
+    # concrete types are checked before the (comparatively slow) abstract `Sequence` check
+    if not isinstance(user_input, str) and isinstance(user_input, (list, tuple, Sequence)):
+        # map each distinct string only once, as bulk input (eg: a column) is highly repetitive
+        strings = [' '.join(s.split()) for s in user_input]
+        mapped_values = {string: mapping_func(string) for string in dict.fromkeys(strings)}
+        return [mapped_values[string] for string in strings]
     if not isinstance(user_input, str):
         raise ValueError('Only a collection of strings (list/tuple/etc) OR a '
                          'single (eg: delimited/dashed string) can be parsed.')
 
-    user_input_ = ' '.join(user_input.split())
     if ' - ' not in user_input:
+        if ',' not in user_input:  # single value, which is by far the most common input
+            return [mapping_func(user_input.strip(' '))]
         return [mapping_func(string.strip(' ')) for string in user_input.split(',')]
 
     # if a dash is in input, attempt to parse as a dashed string
+    user_input_ = ' '.join(user_input.split())
     if user_input.count('-') == 1 and ' - ' not in user_input:
         raise ValueError('Dashed input must be separated by \' - \' (including spaces).')
-    left_token, _, right_token = ' '.join(user_input_.split()).partition(' - ')
+    left_token, _, right_token = user_input_.partition(' - ')  # already whitespace normalized
     left_value, right_value = mapping_func(left_token), mapping_func(right_token)
     if not values_to_slice:  # endpoints only (no order checking here)
         return left_value, right_value
 
     # otherwise we return sliced list
-    values = list(values_to_slice)
+    if isinstance(values_to_slice, AliasTable):
+        left_ordering = values_to_slice.get_ordering(left_value)
+        right_ordering = values_to_slice.get_ordering(right_value)
+        if left_ordering < right_ordering:
+            return [values_to_slice.lookup_by_ordering(ordering)
+                    for ordering in range(left_ordering, right_ordering + 1)]
+        raise ValueError('Dashed strings must be of the form \'LHS - RHS\' where LHS < RHS.')
+
+    # sequences that are already indexable are searched in place rather than copied
+    values = (values_to_slice if isinstance(values_to_slice, (list, tuple)) else
+              list(values_to_slice))
     left_index, right_index = values.index(left_value), values.index(right_value)
     if left_index < right_index:
-        return values[left_index: right_index + 1]
+        return list(values[left_index: right_index + 1])
     raise ValueError('Dashed strings must be of the form \'LHS - RHS\' where LHS < RHS.')
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_date(date: str, as_date_object: bool=False) -> Union[str, datetime.date]:
     """Parse string representing a date.
 
@@ -448,13 +746,73 @@ def parse_date(date: str, as_date_object: bool=False) -> Union[str, datetime.dat
     if time.replace(' ', '') != '':
         raise InvalidInputError(date, 'only date-like strings can be parsed.')
 
+    # fast path for dates of exact form 'YYYY-MM-DD', which skips pandas' format inference
+    # (shape checked first, as `fromisoformat` accepts other iso forms on newer pythons)
+    if len(date) == 10 and date[4] == date[7] == '-':
+        try:
+            dt_ = datetime.date.fromisoformat(date)
+            return dt_ if as_date_object else dt_.strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+
+    import pandas as pd
     try:
-        dt_ = pd.to_datetime(date, infer_datetime_format=True).date()
+        dt_ = pd.to_datetime(date).date()
         return dt_ if as_date_object else dt_.strftime('%Y-%m-%d')
-    except Exception:
-        raise InvalidInputError(date, 'cannot be recognized as a date.')
+    except (ValueError, OverflowError):
+        raise InvalidInputError(date, 'cannot be recognized as a date.') from None
+
 
+def parse_dates(dates: Sequence[str], as_date_objects: bool=False) \
+        -> List[Union[str, datetime.date]]:
+    """Parse sequence of strings representing dates, all in one (vectorized) pass.
 
+    Parameters
+    ----------
+    dates : array-like of strings
+        Strings representing dates, each as accepted by `parse_date`
+    as_date_objects : boolean, False
+        Determines whether to return `datetime.date` objects
+        or strings of the form 'YY-MM-DD'
+
+    Returns
+    -------
+    list of strings or `datetime.date`
+
+    Raises
+    ------
+    `InvalidInputError`
+
+    Notes
+    -----
+    * All dates are handed to `pandas.to_datetime` at once, which is much faster
+      than parsing them one by one. If that fails (eg: the dates are of mixed
+      formats), or any string holds more than a date, then each date is parsed
+      with `parse_date` instead, which raises for the first invalid date
+
+    Examples
+    --------
+    >>> parse_dates(['2013-09-25', '2013-09-26'])
+    ['2013-09-25', '2013-09-26']
+    >>> parse_dates(['9/25/2013', '9/26/2013', '10/1/2013'], as_date_objects=True)
+    [datetime.date(2013, 9, 25), datetime.date(2013, 9, 26), datetime.date(2013, 10, 1)]
+    >>> parse_dates(['9/25/2013', '2013-09-26'])  # mixed formats, each parsed on its own
+    ['2013-09-25', '2013-09-26']
+    """
+    import pandas as pd
+    dates_ = [date.strip(' ') for date in dates]
+    if not any(' ' in date for date in dates_):
+        try:
+            parsed_dates = pd.to_datetime(pd.Series(dates_, dtype=object), errors='raise')
+        except (ValueError, OverflowError):
+            parsed_dates = None
+        if parsed_dates is not None and not parsed_dates.isnull().any():
+            return (list(parsed_dates.dt.date) if as_date_objects else
+                    list(parsed_dates.dt.strftime('%Y-%m-%d')))
+    return [parse_date(date, as_date_object=as_date_objects) for date in dates_]
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_time(time: str, as_time_object: bool=False) -> Union[str, datetime.time]:
     """Parse string representing a time of day.
 
@@ -504,13 +862,23 @@ def parse_time(time: str, as_time_object: bool=False) -> Union[str, datetime.tim
     datetime.time(0, 31)
     """
     time_string = time.lower().replace(' ', '')
-    is_twelve_hour_time = time_string.endswith('am') or time_string.endswith('pm')
+    is_twelve_hour_time = time_string[-2:] in ('am', 'pm')
+    num_colons = time_string.count(':')
     inferred_format = '%I' if is_twelve_hour_time else '%H'
-    if ':' in time_string:
-        inferred_format += ':%M' if time_string.count(':') == 1 else ':%M:%S'
+    if num_colons:
+        inferred_format += ':%M' if num_colons == 1 else ':%M:%S'
     if is_twelve_hour_time:
         inferred_format += '%p'
-
+    else:  # fast path for 24 hour times of form 'H[:M[:S]]', which avoids pandas entirely
+        components = time_string.split(':')
+        if len(components) <= 3 and all(component.isdigit() and component.isascii() and
+                                         len(component) <= 2 for component in components):
+            hour, minute, second = ([int(component) for component in components] + [0, 0])[:3]
+            if hour < 24 and minute < 60 and second < 60:
+                time_object = datetime.time(hour, minute, second)
+                return time_object if as_time_object else str(time_object)
+
+    import pandas as pd
     try:
         time_object = pd.to_datetime(
             time_string, format=inferred_format, exact=True, infer_datetime_format=True
@@ -520,7 +888,8 @@ def parse_time(time: str, as_time_object: bool=False) -> Union[str, datetime.tim
         raise InvalidInputError(time, 'cannot be recognized as a time.')
 
 
-def parse_datetime(dt: str, as_timestamp_object: bool=False) -> Union[str, pd.Timestamp]:
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(dt: str, as_timestamp_object: bool=False) -> Union[str, 'pd.Timestamp']:
     """Parse string representing a datetime.
 
     Parameters
@@ -563,16 +932,27 @@ def parse_datetime(dt: str, as_timestamp_object: bool=False) -> Union[str, pd.Ti
     >>> parse_datetime('2015-2-2 00:21:00', as_timestamp_object=True)
     Timestamp('2015-02-02 00:21:00')
     """
-    date, _, time = ' '.join(dt.split()).partition(' ')
-    try:
-        date_ = parse_date(date, as_date_object=True) if date else None
-        time_ = parse_time(time, as_time_object=True) if time else datetime.time(0, 0, 0)
-        dt_ = pd.Timestamp.combine(date_, time_)
-        return dt_ if as_timestamp_object else dt_.strftime('%Y-%m-%d %H:%M:%S')
-    except Exception:
-        raise InvalidInputError(dt, 'must consist of a valid date followed by an optional valid time.')
+    try:  # fast path for datetimes already in canonical form (eg: as stored in the database)
+        dt_ = datetime.datetime.strptime(dt, '%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        dt_ = None
+
+    if dt_ is None:
+        date, _, time = ' '.join(dt.split()).partition(' ')
+        try:
+            date_ = parse_date(date, as_date_object=True) if date else None
+            time_ = parse_time(time, as_time_object=True) if time else datetime.time(0, 0, 0)
+            dt_ = datetime.datetime.combine(date_, time_)
+        except Exception:
+            raise InvalidInputError(dt, 'must consist of a valid date followed by an optional valid time.')
+
+    if not as_timestamp_object:  # pandas is only needed for the timestamp object itself
+        return dt_.strftime('%Y-%m-%d %H:%M:%S')
+    import pandas as pd
+    return pd.Timestamp(dt_)
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_quarter(quarter: str, with_year: bool=True) -> str:
     """Parse string representing an academic quarter.
 
@@ -607,16 +987,61 @@ def parse_quarter(quarter: str, with_year: bool=True) -> str:
     'Spring 2012'
     """
     quarter_name, _, quarter_year = quarter.lower().partition(' ')
-    map_term, map_year = TIME_UNIT_VALUES.QUARTERS.lookup_by_alias, TIME_UNIT_VALUES.YEARS.lookup_by_alias
     try:
-        return (map_term(quarter_name) + ' ' + map_year(quarter_year) if with_year else
-                map_term(quarter_name))
+        return (_LOOKUP_QUARTER(quarter_name) + ' ' + _LOOKUP_YEAR(quarter_year) if with_year else
+                _LOOKUP_QUARTER(quarter_name))
     except InvalidInputError:
         message = f'quarter name must correspond to on of {TIME_UNIT_VALUES.QUARTERS.names}'
         message += ' followed by a 2 or 4 digit year in current century.' if with_year else '.'
         raise InvalidInputError(quarter, message) from None
 
 
+@functools.lru_cache(maxsize=1)
+def _get_all_courses() -> FrozenSet[str]:
+    """Return all courses on record, read from the warehouse only once.
+
+    Notes
+    -----
+    * Call `_get_all_courses.cache_clear()` after the underlying tutor request
+      data is updated, so that newly recorded courses are recognized
+    """
+    from stem_center_analytics import warehouse
+    return frozenset(warehouse.get_set_of_all_courses())
+
+
+@functools.lru_cache(maxsize=4096)
+def _segment_course_name(course_name: str) -> Tuple[str, str, str]:
+    """Return cleaned (but unmapped) subject, number, and section of given course name.
+
+    See Also
+    --------
+    * Steps 1-3 of the algorithm outlined in the notes of `parse_course`
+    """
+    course_name_ = ' '.join(course_name.split()).lower()
+    first_digit = _FIRST_DIGIT_PATTERN.search(course_name_)
+    first_digit_position = first_digit.start() if first_digit else -1
+    if first_digit_position == -1:  # assume subject if input has no digits
+        subject, number, section = course_name.strip(' '), '', ''
+    else:  # otherwise, segment into three components (still works if section not present!)
+        subject = course_name_[:first_digit_position].rstrip(' ')  # no leading space once normalized
+        number, _, section = course_name_[first_digit_position:].upper().partition(' ')
+
+    # an 'f' padding number will be at the end of subject string since input sliced at 1st digit
+    for suffix in ('. f', '.', ' f'):  # remove trailing '.', ' f', '. f'
+        if subject.endswith(suffix):
+            subject = subject[:-len(suffix)]
+            break
+    if number.startswith('00'):  # remove up to 2 leading 0s and 1 trailing '.'
+        number = number[2:]
+    elif number.startswith('0'):
+        number = number[1:]
+    if number.endswith('.'):
+        number = number[:-1]
+    if section.startswith('0'):  # remove leading 0 (section is upper cased, so no 'o' remains)
+        section = section[1:]
+    return subject, number, section
+
+
 def parse_course(course_name: str, check_records: bool=False) -> str:
     """Parse string representing a Foothill College course.
 
@@ -678,26 +1103,16 @@ def parse_course(course_name: str, check_records: bool=False) -> str:
     >>> parse_course('Comp Sci 1B')
     'Computer Science 1B'
     """
-    course_name_ = ' '.join(course_name.split()).lower()
-    first_digit_position = next((k for k, char in enumerate(course_name_) if char.isdigit()), -1)
-    if first_digit_position == -1:  # assume subject if input has no digits
-        subject, number, section = course_name.strip(' '), '', ''
-    else:  # otherwise, segment into three components (still works if section not present!)
-        subject = course_name_[0:first_digit_position].strip(' ')
-        number, _, section = course_name_[first_digit_position:].upper().partition(' ')
-
-    # an 'f' padding number will be at the end of subject string since input sliced at 1st digit
-    subject = re.sub('(\. f|\.| f)?$', '', subject)  # remove trailing '.', ' f', '. f'
-    number = re.sub('^0{,2}|(\.)?$', '', number)     # remove up to 3 leading 0s and 1 trailing '.'
-    section = re.sub('^0|o', '', section)            # remove leading occurrence of o or 0
+    subject, number, section = _segment_course_name(course_name)
     if not check_records:
-        subject_ = ALL_SUBJECTS.lookup_by_alias(subject)       # let it raise
+        subject_ = _LOOKUP_SUBJECT(subject)  # let it raise
         return ' '.join([subject_, number, section]).strip(' ')
 
     # --------- otherwise, check records, and if not available report the reason for missing
-    set_of_all_courses = warehouse.get_set_of_all_courses()
+    course_name_ = ' '.join(course_name.split()).lower()
+    set_of_all_courses = _get_all_courses()
     try:
-        subject = ALL_SUBJECTS.lookup_by_alias(subject)
+        subject = _LOOKUP_SUBJECT(subject)
         if subject not in set_of_all_courses:
             raise InvalidInputError
     except InvalidInputError:
@@ -1,5 +1,5 @@
 """Contains aggregate calculations functions."""
-from typing import Iterable, Mapping
+from typing import Iterable, Mapping, Union
 
 import numpy as np
 import pandas as pd
@@ -9,17 +9,18 @@ from stem_center_analytics.core import input_validation
 # todo: generalize statistical calculations present in scripts, and move here
 # todo: replace below `SORT_ORDER` with input validation keys
 
+_QUARTER_ORDER = tuple(f'{q} {y}' for y in range(2000, 3000) for q in ('W', 'S', 'U', 'F'))
 SORT_ORDER = {
     'hour': tuple(range(0, 24)),
     'day': tuple(range(0, 24)),
     'year': tuple(range(2000, 3000)),
-    'quarter': tuple([q + ' ' + str(y) for y in range(2000, 3000) for q in ('W', 'S', 'U', 'F')])
+    'quarter': _QUARTER_ORDER
 }
 
 
 def get_avg_wait_time(sc_data: pd.DataFrame, interval_option: str) -> pd.DataFrame:
     """Return given DF aggregated by given column according to interval option (year/day/etc.)."""
-    aggregated_df = sc_data.groupby([sc_data.index.hour]).aggregate({'wait_time': np.mean})
+    aggregated_df = sc_data.groupby([sc_data.index.hour])[['wait_time']].mean()
     interval_option_ = input_validation.TIME_UNIT_NAMES.lookup_by_alias(interval_option)  # unsorted for now...
     return _sort_index_by_list(df=aggregated_df, rank_order=SORT_ORDER[interval_option_])
 
@@ -40,32 +41,35 @@ def avg_by_year(sc_data: pd.DataFrame) -> pd.DataFrame:
 def _average_col_by_interval(sc_data: pd.DataFrame, col_name: str,
                              interval_option: str) -> pd.DataFrame:
     """Return given DF aggregated by given column according to interval option (year/day/etc.)."""
-    return sc_data.groupby([interval_option]).aggregate({col_name: np.mean})
+    return sc_data.groupby([interval_option])[[col_name]].mean()
 
 
 def _sort_index_by_list(df: pd.DataFrame, rank_order: Iterable[object]) -> pd.DataFrame:
-    """Return given DF sorted by given columns according to `rank_order`."""
+    """Return given DF sorted by given columns according to `rank_order`.
+
+    Notes
+    -----
+    * Index values not present in `rank_order` are kept, after the ranked ones,
+      in their existing order
+    """
     # todo: add ability to sort numpy array by list as well, if necessary.
-    df_ = df
-    sort_order = list(rank_order)
-    rank_mappings = dict(zip(sort_order, range(0, len(sort_order))))  # build list index/value dict
-    rank_col = df_.index.map(lambda k: rank_mappings[k])              # lookup_by_alias index values for col
-    df_.insert(loc=len(df_.columns), column='rank', value=rank_col)   # append rank_col to end of df
-    df_.sort_values(by=['rank'], axis=0, inplace=True)    # sort the index by rank
-    df_.drop(labels=['rank'], axis=1, inplace=True)       # now drop the rank column
-    return df_
+    index_values = set(df.index)
+    ranked_keys = [key for key in rank_order if key in index_values]
+    ranked_key_set = set(ranked_keys)
+    return df.reindex(ranked_keys + [key for key in df.index if key not in ranked_key_set])
 
 
 def _aggregate_sc_data(sc_data: pd.DataFrame,
-                       aggregate_option: Mapping[str, callable],
+                       aggregate_option: Mapping[str, Union[str, callable]],
                        interval_type: str) -> pd.DataFrame:
     """Aggregate given DF on given column according to given time interval.
 
     Parameters
     ----------
     if index in aggregate option, then groupby index instead...
-    aggregate_option : Mapping[str, callable]
-        numpy function to apply element-wise, such as {'count', 'median', 'mean'}
+    aggregate_option : Mapping[str, str or callable]
+        numpy function to apply element-wise, or name of the pandas aggregation
+        (which runs group-wise in C), such as {'count', 'median', 'mean'}
     interval_type : {hour, day_in_week, week_in_quarter, month, quarter, year}
         interval to compute on
 
@@ -91,8 +95,7 @@ def _aggregate_sc_data(sc_data: pd.DataFrame,
         aggregated_df.rename(columns={'quarter': 'num_requests'}, inplace=True)
 
     if interval_type == 'quarter':  # ordering undefined for quarter strings, so sort output...
-        quarters = [q + ' ' + str(y) for y in range(2000, 3000) for q in ('W', 'S', 'U', 'F')]
-        return _sort_index_by_list(df=aggregated_df, rank_order=quarters)
+        return _sort_index_by_list(df=aggregated_df, rank_order=_QUARTER_ORDER)
     return aggregated_df
 
 
@@ -119,7 +122,7 @@ def compute_metric_on_intervals(sc_data: pd.DataFrame, interval_type: str,
     if metric_type_ == 'demand':
         aggregate_mappings = {'quarter': np.count_nonzero}  # arbitrary column name for counting
     elif metric_type_ == 'wait_time':
-        aggregate_mappings = {'wait_time': np.mean}  # explicitly give column to average on
+        aggregate_mappings = {'wait_time': 'mean'}  # explicitly give column to average on
     else:
         raise ValueError('Internal Error')
     return _aggregate_sc_data(sc_data, aggregate_option=aggregate_mappings,
@@ -15,15 +15,20 @@ wrapper classes provide:
   (i.e.: if you filtered all mondays on TutorLog, then the corresponding DF
   remembers it's last modified state.
 """
-import datetime
 from functools import partial
 from typing import Iterable, Sequence, Union, List
 
+import numpy as np
 import pandas as pd
 
 from stem_center_analytics import warehouse
 from stem_center_analytics.core import input_validation as prs
 
+# establish wide dataframe display (set here rather than on package import, which avoids pandas)
+pd.set_option('display.max_rows', 50)
+pd.set_option('display.max_columns', 20)
+pd.set_option('display.width', 750)
+
 
 # WARNING -- THIS MODULE IS AN UNSTABLE WORK IN PROGRESS!
 # --------------------------------------------------------------------------------------------------
@@ -51,11 +56,41 @@ class _SCWrapper(object):
         df (Pandas DataFrame): the CORE_SUBJECTS stem center data_samples to operate on.
     """
 
+    # string columns with few distinct values, stored as categories so filtering compares codes
+    # (numeric columns are left as is, so they can still be compared and grouped on as numbers)
+    CATEGORICAL_COLUMNS = ('quarter',)
+
     def __init__(self, df: pd.DataFrame):
+        df = df.astype({col: 'category' for col in self.CATEGORICAL_COLUMNS if col in df.columns})
+        if not df.index.is_monotonic_increasing:  # sorted once, so datetimes can be binary searched
+            df = df.sort_index()
         self._entire_df = df
-        print(self._entire_df)
         self.data = df   # allows mutability  -- saves the current 'filtered' state
 
+    @property
+    def data(self) -> pd.DataFrame:
+        """Return the current 'filtered' DF, applying any pending column filters in one pass."""
+        if self._pending_filters:
+            # swapped out first, so a failed filter is never left pending
+            filters, self._pending_filters = self._pending_filters, []
+            mask = np.ones(len(self._data), dtype=bool)
+            for col, values in filters:
+                mask &= self._data[col].isin(values).values
+            self._data = self._data[mask]
+        return self._data
+
+    @data.setter
+    def data(self, df: pd.DataFrame):
+        self._data = df
+        self._pending_filters = []
+
+    def _filter_by_values(self, col: str, values: Iterable[object]):
+        """Defer filtering rows to those with `col` in values, so chained filters select once."""
+        if col not in self._data.columns:
+            raise KeyError(f'Column \'{col}\' is not present in the data.')
+        self._pending_filters.append((col, values))
+        return self
+
     def __repr__(self):
         return repr(self.data)
 
@@ -68,7 +103,8 @@ class _SCWrapper(object):
 
     def reset_data(self):
         """Reset `data` to `all_data`."""
-        self.data = self._entire_df.copy()
+        # filters always rebind `data` rather than modify it, so the entire DF is never mutated
+        self.data = self._entire_df
         return self
 
     def filter_by_datetime(self, dates: Union[str, Sequence[str]]):
@@ -106,26 +142,27 @@ class _SCWrapper(object):
         >>> parse_datetime_range('2015/08/01 - 2015/08/02 3:00:42')
         ('2015-08-01 00:00:00', '2015-08-02 03:00:42')
         """
-        def parse_datetime_(dt):
-            return pd.to_datetime(prs.parse_date(dt))
-
-        date_objects = prs.parse_user_input(user_input=dates, mapping_func=parse_datetime_)
-        dates_ = [datetime.datetime.strftime(date, '%Y-%m-%d') for date in date_objects]
-
-        if ' - ' in dates:
+        # dates are parsed directly to strings of form '%Y-%m-%d', as used for slicing below
+        if isinstance(dates, str):
+            dates_ = prs.parse_user_input(user_input=dates, mapping_func=prs.parse_date)
+        else:  # bulk dates are all parsed in a single vectorized pass
+            dates_ = prs.parse_dates(dates)
+
+        if isinstance(dates, str) and ' - ' in dates:
+            # index is sorted, so binary search for the rows from start of first day to end of last
             start, end = dates_
-            self.data = self.data.ix[start:end]
-        else:
-            pass
-            # figure out an 'isin' for indices
-            # self.data = self.data[self.data[]]
+            left = self.data.index.searchsorted(pd.Timestamp(start), side='left')
+            right = self.data.index.searchsorted(pd.Timestamp(end) + pd.Timedelta(days=1), side='left')
+            self.data = self.data.iloc[left:right]
+        else:  # keep only the rows falling on any of the given dates
+            self.data = self.data[self.data.index.normalize().isin(pd.to_datetime(dates_))]
         return self
 
     def filter_by_year(self, years: Union[str, Sequence[str]]):
         years_ = prs.parse_user_input(
             user_input=years,
             mapping_func=lambda yr: prs.TIME_UNIT_VALUES.YEARS.lookup_by_alias(alias=str(yr)),
-            values_to_slice=prs.TIME_UNIT_VALUES.YEARS.keys()
+            values_to_slice=prs.TIME_UNIT_VALUES.YEARS
         )
         # filter by year here...
         return self
@@ -151,33 +188,45 @@ class _SCWrapper(object):
                 raise prs.InvalidInputError(quarters, 'only quarters with years can be '
                                                       'parsed as dashed input.')
 
-        keys = (prs.TIME_UNIT_VALUES.QUARTERS_WITH_YEARS.keys() if with_years else
-                prs.TIME_UNIT_VALUES.QUARTERS.keys())
+        # ranges are sliced by table orderings (for quarters with years, computed from term and year)
+        table = (prs.TIME_UNIT_VALUES.QUARTERS_WITH_YEARS if with_years else
+                 prs.TIME_UNIT_VALUES.QUARTERS)
         quarters_ = prs.parse_user_input(
             user_input=quarters,
             mapping_func=prs.parse_quarter,
-            values_to_slice=keys
+            values_to_slice=table
         )
-        self.data = self.data[self.data['quarter'].isin(quarters_)]
-        return self
+        return self._filter_by_values('quarter', quarters_)
 
     def filter_by_week_in_quarter(self, weeks: Sequence):
+        """Filter by week in quarter (eg: 1, 2 or 1 - 3, dash supported).
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'week_in_quarter': [1, 2, 3, 4]},
+        ...                   index=pd.date_range('2013-09-23', periods=4, freq='7D'))
+        >>> len(_SCWrapper(df).filter_by_week_in_quarter('1 - 3').data)
+        3
+        >>> len(_SCWrapper(df).filter_by_week_in_quarter('2, 4').data)
+        2
+        """
         weeks_ = prs.parse_user_input(
             user_input=weeks,
             mapping_func=prs.TIME_UNIT_VALUES.WEEKS_IN_QUARTER.lookup_by_alias,
-            values_to_slice=prs.TIME_UNIT_VALUES.WEEKS_IN_QUARTER.keys()
+            values_to_slice=prs.TIME_UNIT_VALUES.WEEKS_IN_QUARTER
         )
-        self.data = self.data[self.data['week_in_quarter'].isin(weeks_)]
-        return self
+        # weeks in quarter are stored as integers, whereas table names are strings
+        return self._filter_by_values('week_in_quarter', [int(week) for week in weeks_])
 
     def filter_by_day(self, days: Union[str, int, Sequence[Union[str, int]]]):
         days_ = prs.parse_user_input(
             user_input=days,
             mapping_func=prs.TIME_UNIT_VALUES.WEEKDAYS.lookup_by_alias,
-            values_to_slice=prs.TIME_UNIT_VALUES.WEEKDAYS.keys()
+            values_to_slice=prs.TIME_UNIT_VALUES.WEEKDAYS
         )
-        self.data = self.data[self.data['day'].isin(days_)]
-        return self
+        # days in week are stored from sunday=1 to saturday=7, whereas table orderings start at monday
+        day_numbers = [prs.TIME_UNIT_VALUES.WEEKDAYS.get_ordering(day) % 7 + 1 for day in days_]
+        return self._filter_by_values('day_in_week', day_numbers)
 
     def filter_by_time_of_day(self, time_range: str):
         """Parse string representing time of day to two time strings of format='HH[:MM:SS]'.
@@ -37,7 +37,7 @@ def _prepare_file_for_creation(file_path: str, extension: str, replace_if_exists
     os_lib.ensure_path_is_absolute(file_path)
     os_lib.ensure_valid_file_type(file_path, extension)
     if replace_if_exists and os_lib.is_existent_file(file_path):
-        os_lib.remove_file(file_path)
+        os_lib.remove_file(file_path)  # raises OSError if the existing file cannot be removed
     # error if not replace_if_exists AND file already exists
     os_lib.ensure_file_is_creatable(file_path)
 
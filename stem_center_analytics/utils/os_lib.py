@@ -20,7 +20,7 @@ import errno
 import codecs
 import shutil
 import inspect
-import importlib
+import importlib.util
 import contextlib
 from typing import Sequence
 
@@ -110,8 +110,7 @@ def remove_directory(dir_path: str, ignore_errors=False) -> None:
     """Remove directory and all children at given path, with an option of ignoring any Errors."""
     dir_path_ = os.path.normpath(dir_path.strip(' '))
     if ignore_errors:
-        with contextlib.suppress(OSError):
-            shutil.rmtree(path=dir_path_, ignore_errors=True)
+        shutil.rmtree(path=dir_path_, ignore_errors=True)  # rmtree already suppresses any OSError
     else:
         try:
             ensure_directory_exists(dir_path_)
@@ -124,8 +123,10 @@ def remove_file(file_path: str, ignore_errors=False) -> None:
     """Remove file at given path, with an option of ignoring any Errors."""
     file_path_ = os.path.normpath(file_path.strip(' '))
     if ignore_errors:
-        with contextlib.suppress(OSError):
+        try:
             os.remove(file_path_)
+        except OSError:
+            pass
     else:
         try:
             ensure_file_exists(file_path_)
@@ -161,7 +162,7 @@ def change_directory(dir_path: str) -> str:
 
 # ---------------------------------------- error checking ------------------------------------------
 def ensure_successful_imports(path: str, names: Sequence[str]) -> None:
-    """Valid if all object names are successfully imported at given path location.
+    """Valid if all module names can be successfully imported at given path location.
 
     Parameters
     ----------
@@ -169,9 +170,9 @@ def ensure_successful_imports(path: str, names: Sequence[str]) -> None:
         Path at which to import the given names. If file path given,
         names are imported from its parent directory
     names : array-like of str
-        Names of objects to import in the order given. This can be the name of
-        any importable object, but to ensure successful imports favor
-        full, absolute import names such as 'package.module.func', over '.func'
+        Names of modules to import in the order given. To ensure successful
+        imports favor full, absolute import names such as 'package.module',
+        over '.module'
 
     Raises
     ------
@@ -180,7 +181,9 @@ def ensure_successful_imports(path: str, names: Sequence[str]) -> None:
 
     Notes
     -----
-    * Imports are lost (goes out of scope) once the function returns
+    * Names are only located via `importlib.util.find_spec`, and thus the
+      modules themselves are never executed. Note however that parent packages
+      of dotted names are still imported in order to search their paths
     """
     path_ = os.path.normpath(path.strip(' '))
     dir_to_import_at = path_ if os.path.isdir(path_) else os.path.normpath(os.path.dirname(path_))
@@ -190,8 +193,9 @@ def ensure_successful_imports(path: str, names: Sequence[str]) -> None:
     with change_directory(dir_to_import_at):
         for name in names:
             try:
-                importlib.import_module(name)
-            except ImportError:
+                if importlib.util.find_spec(name) is None:
+                    unsuccessful_imports.append(name)
+            except (ImportError, ValueError):  # parent package missing, or has no spec
                 unsuccessful_imports.append(name)
     if unsuccessful_imports:
         raise ImportError(f'Failed to import modules - {tuple(unsuccessful_imports)}.')
@@ -299,7 +303,8 @@ def ensure_valid_file_type(file_path: str, file_type: str) -> None:
       given path is NOT checked for existence
     """
     file_type_ = file_type.lstrip('.')
-    file_name, file_extension = get_basename(file_path), get_extension(file_path).lstrip('.')
+    file_name = os.path.basename(os.path.normpath(file_path.strip(' ')))
+    file_extension = os.path.splitext(file_name)[-1].lower().lstrip('.')
     if file_name.count('.') != 1:
         raise ValueError(f'File \'{file_name}\' is invalid - file name must have a single extension.')
     if file_extension != file_type_:
@@ -350,5 +355,5 @@ def get_parent_dir(path: str) -> str:
 def get_basename(path: str, include_extension: bool=True) -> str:
     """Return unix-style basename (eg: '/foo/bar/' => 'bar')."""
     # normalize path, and return the last component
-    name = os.path.split(os.path.normpath(path.strip(' ')))[-1]
+    name = os.path.basename(os.path.normpath(path.strip(' ')))
     return name if include_extension else os.path.splitext(name)[0]
@@ -8,7 +8,7 @@ Notes
 from stem_center_analytics.warehouse.data_models import (
     DATA_FILE_PATHS,
     get_student_login_data, get_tutor_request_data,
-    connect_to_stem_center_db, get_quarter_dates,
+    connect_to_stem_center_db, get_quarter_dates, get_quarter_by_date,
     get_course_records, get_set_of_all_courses
 )
 __all__ = ['_data_models.py']
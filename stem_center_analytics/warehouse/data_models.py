@@ -13,6 +13,7 @@ Notes
   * ??
 """
 import sqlite3
+import functools
 from collections import namedtuple
 from typing import Sequence, Tuple, Union, Dict, List, Set
 
@@ -36,11 +37,35 @@ def connect_to_stem_center_db() -> sqlite3.Connection:
     return io_lib.connect_to_sqlite_database(DATA_FILE_PATHS.DATABASE)
 
 
+@functools.lru_cache(maxsize=1)
 def get_quarter_dates() -> pd.DataFrame:
-    """Return DataFrame of all (manually entered) quarter start, end dates."""
+    """Return DataFrame of all (manually entered) quarter start, end dates.
+
+    Notes
+    -----
+    * The file is only read once, with the same DataFrame returned on every
+      subsequent call, so it must not be modified in place
+    """
     return io_lib.read_csv_file(DATA_FILE_PATHS.QUARTER_DATES, num_rows=None, date_columns=[1, 2])
 
 
+def get_quarter_by_date(date: str) -> str:
+    """Return quarter in which given date resides (eg: '2013-09-25'-> 'Fall 2013').
+
+    Raises
+    ------
+    ValueError
+        * If date does not fall between the start and end dates of any quarter
+    """
+    df = get_quarter_dates()
+    date_ = pd.Timestamp(date)
+    # quarters are stored in chronological order, so binary search for the last one started by date
+    position = int(df['start_date'].values.searchsorted(date_.to_datetime64(), side='right')) - 1
+    if position >= 0 and date_ <= df['end_date'].iloc[position]:
+        return df.index[position]
+    raise ValueError(f'Date {date} does not fall between dates of any archived quarters.')
+
+
 def get_tutor_request_data(columns_to_use: Sequence[str]=(), as_unique: bool=False) \
         -> Union[pd.DataFrame, np.ndarray]:
     """Return DataFrame of tutor requests from the database.